@@ -7,17 +7,18 @@ Preserves exact SVG layout positions
 
 import bpy
 import os
-import sys
-from mathutils import Vector
+
+# Per-element progress lines (ALTER_VERBOSE=1), off by default to keep headless logs short
+VERBOSE = os.environ.get("ALTER_VERBOSE") == "1"
 
 def clean_scene():
     """Remove all objects from scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-
-    # Clean materials
-    for mat in bpy.data.materials:
-        bpy.data.materials.remove(mat)
+    # Objects and the data they use, one batch_remove per collection -
+    # no operator context/undo overhead
+    data = bpy.data
+    for collection in (data.objects, data.meshes, data.materials, data.curves,
+                       data.lights, data.cameras, data.actions):
+        data.batch_remove(ids=list(collection))
 
     print("✓ Scene cleaned")
 
@@ -27,6 +28,9 @@ def import_svg_preserve_positions(svg_path):
     Import SVG and preserve element positions by setting origin to geometry
     Each element's location will reflect its actual position in space
     """
+    import numpy as np
+    from mathutils import Vector
+
     if not os.path.exists(svg_path):
         print(f"✗ SVG not found: {svg_path}")
         return []
@@ -53,23 +57,45 @@ def import_svg_preserve_positions(svg_path):
 
     print(f"✓ Imported {len(imported)} SVG elements")
 
+    # Convert all curves to meshes with one operator call - objects are
+    # converted in place, so the imported references stay valid
+    with bpy.context.temp_override(active_object=imported[0], object=imported[0],
+                                   selected_objects=imported,
+                                   selected_editable_objects=imported):
+        bpy.ops.object.convert(target='MESH')
+
     elements = []
+    shared_meshes = {}  # Geometry signature -> first mesh with that shape
 
-    for i, curve_obj in enumerate(imported):
-        # Convert curve to mesh first
-        bpy.context.view_layer.objects.active = curve_obj
-        bpy.ops.object.convert(target='MESH')
-        mesh_obj = bpy.context.active_object
+    for i, mesh_obj in enumerate(imported):
         mesh_obj.name = f"LogoElement_{i}"
-
-        # CRITICAL: Set origin to geometry center
-        # This moves the object's origin to where the geometry actually is
-        # and updates mesh_obj.location to the real position
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+        mesh = mesh_obj.data
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+
+        # CRITICAL: Set origin to geometry bounds center
+        # Vertices move by -center and the object by +center, so the element
+        # stays in place and mesh_obj.location becomes its real position
+        if len(co):
+            center = (co.min(axis=0) + co.max(axis=0)) * 0.5
+            co -= center
+            mesh.vertices.foreach_set("co", co.ravel())
+            mesh.update()
+            mesh_obj.location += mesh_obj.matrix_basis.to_3x3() @ Vector(center.tolist())
+
+        # Repeated glyph shapes share one mesh (origins are centered, so
+        # identical shapes have identical local coordinates)
+        signature = (len(mesh.polygons), co.round(4).tobytes())
+        shared = shared_meshes.setdefault(signature, mesh)
+        if shared is not mesh:
+            mesh_obj.data = shared
+            bpy.data.meshes.remove(mesh)
 
         # Now mesh_obj.location is the REAL position in space
-        print(f"  Element {i} ({mesh_obj.name}):")
-        print(f"    Position: X={mesh_obj.location.x:.3f}, Y={mesh_obj.location.y:.3f}, Z={mesh_obj.location.z:.3f}")
+        if VERBOSE:
+            print(f"  Element {i} ({mesh_obj.name}):")
+            print(f"    Position: X={mesh_obj.location.x:.3f}, Y={mesh_obj.location.y:.3f}, Z={mesh_obj.location.z:.3f}")
 
         # Add solidify to give thickness
         solidify = mesh_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
@@ -85,7 +111,12 @@ def create_fast_fire_material():
     """
     Create fire material using EMISSION shader with noise
     NO FLUID SIMULATION - instant, no baking needed
+    Built once - later calls return the existing material
     """
+    mat = bpy.data.materials.get("FastFire")
+    if mat:
+        return mat
+
     mat = bpy.data.materials.new(name="FastFire")
     mat.use_nodes = True
     mat.blend_method = 'BLEND'
@@ -121,15 +152,19 @@ def create_fast_fire_material():
     links.new(colorramp.outputs[0], emission.inputs['Color'])
     links.new(colorramp.outputs[1], mix.inputs[0])  # Alpha for transparency
 
-    # Set fire color gradient
-    colorramp.color_ramp.elements[0].position = 0.0
-    colorramp.color_ramp.elements[0].color = (0, 0, 0, 1)  # Black
-    colorramp.color_ramp.elements.new(0.3)
-    colorramp.color_ramp.elements[1].color = (0.8, 0.1, 0.0, 1)  # Red
-    colorramp.color_ramp.elements.new(0.6)
-    colorramp.color_ramp.elements[2].color = (1.0, 0.4, 0.0, 1)  # Orange
-    colorramp.color_ramp.elements.new(0.9)
-    colorramp.color_ramp.elements[3].color = (1.0, 0.9, 0.3, 1)  # Yellow
+    # Set fire color gradient - all stops written in one pass
+    ramp_stops = (
+        (0.0, (0, 0, 0, 1)),  # Black
+        (0.3, (0.8, 0.1, 0.0, 1)),  # Red
+        (0.6, (1.0, 0.4, 0.0, 1)),  # Orange
+        (0.9, (1.0, 0.9, 0.3, 1)),  # Yellow
+        (1.0, (1, 1, 1, 1)),  # White (default end stop)
+    )
+    elements = colorramp.color_ramp.elements
+    for position, _ in ramp_stops[len(elements):]:
+        elements.new(position)
+    elements.foreach_set("position", [position for position, _ in ramp_stops])
+    elements.foreach_set("color", [c for _, color in ramp_stops for c in color])
 
     # Noise texture for fire animation
     noise = nodes.new('ShaderNodeTexNoise')
@@ -158,19 +193,23 @@ def create_fast_fire_material():
     return mat
 
 
-def create_fire_for_element(element, index):
+def create_fire_for_element(element, index, fire_mat):
     """
     Create fast fire effect using wireframe + emission shader
     NO FLUID - instant setup, no baking
+    All emitters share the single fire_mat datablock and their element's mesh
     """
-    # Duplicate element for fire emitter
-    bpy.ops.object.select_all(action='DESELECT')
-    element.select_set(True)
-    bpy.context.view_layer.objects.active = element
-    bpy.ops.object.duplicate()
-
-    emitter = bpy.context.active_object
-    emitter.name = f"FireEmitter_{index}"
+    # Emitter object shares the element's mesh instead of duplicating it
+    emitter = bpy.data.objects.new(f"FireEmitter_{index}", element.data)
+    for collection in element.users_collection:
+        collection.objects.link(emitter)
+
+    # Same thickness as the element (modifiers are per object)
+    for source in element.modifiers:
+        if source.type == 'SOLIDIFY':
+            solidify = emitter.modifiers.new(name=source.name, type='SOLIDIFY')
+            solidify.thickness = source.thickness
+            solidify.offset = source.offset
 
     # Wireframe modifier - fire along edges
     wireframe = emitter.modifiers.new(name="Wireframe", type='WIREFRAME')
@@ -178,19 +217,16 @@ def create_fire_for_element(element, index):
     wireframe.use_replace = True
     wireframe.use_boundary = True
 
-    # Parent to element
+    # Parent to element - identity offset keeps the emitter on the element
     emitter.parent = element
-    emitter.matrix_parent_inverse = element.matrix_world.inverted()
 
-    # Apply fast fire material
-    fire_mat = bpy.data.materials.get("FastFire")
-    if not fire_mat:
-        fire_mat = create_fast_fire_material()
-
-    if len(emitter.data.materials):
-        emitter.data.materials[0] = fire_mat
-    else:
-        emitter.data.materials.append(fire_mat)
+    # Apply the shared fast fire material on an object-linked slot so the
+    # shared mesh keeps the element's own material
+    if not element.data.materials:
+        element.data.materials.append(None)
+    slot = emitter.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = fire_mat
 
     # Hide from render (we see the glow but not the geometry)
     emitter.hide_render = True
@@ -204,47 +240,62 @@ def animate_sequential(elements):
     Elements start FAR on Y axis, arrive at current position
     Only Y axis moves - X and Z stay as imported from SVG
     """
+    import numpy as np
+
     start_y_offset = -50.0  # How far to push elements back
     duration = 40  # Frames for each element to arrive
     gap = 25  # Gap between element starts
 
     print("\n✓ Animating elements sequentially:")
 
+    # Frame timing for every element at once
+    start_frames = 1 + np.arange(len(elements)) * gap
+    end_frames = start_frames + duration
+
+    # END position - where SVG import placed each element
+    # START position - pushed back on Y axis only
+    end_positions = np.array([tuple(element.location) for element in elements], dtype=np.float32)
+    start_positions = end_positions.copy()
+    start_positions[:, 1] += start_y_offset
+
+    # Y keyframe (frame, value) pairs per element, ready for foreach_set
+    # X and Z never change, so they stay static object properties
+    co = np.empty((len(elements), 4), dtype=np.float32)
+    co[:, 0] = start_frames
+    co[:, 1] = start_positions[:, 1]
+    co[:, 2] = end_frames
+    co[:, 3] = end_positions[:, 1]
+
+    # Smooth BEZIER keys with AUTO_CLAMPED handles (enum codes from RNA)
+    keyframe_props = bpy.types.Keyframe.bl_rna.properties
+    bezier = keyframe_props['interpolation'].enum_items['BEZIER'].value
+    auto_clamped = keyframe_props['handle_left_type'].enum_items['AUTO_CLAMPED'].value
+    interpolation = np.full(2, bezier, dtype=np.int32)
+    handle_type = np.full(2, auto_clamped, dtype=np.int32)
+
     for i, element in enumerate(elements):
-        # Get current position (where SVG import placed it)
-        current_x = element.location.x
-        current_y = element.location.y
-        current_z = element.location.z
-
-        # Frame timing
-        start_frame = 1 + (i * gap)
-        end_frame = start_frame + duration
-
-        print(f"  Element {i}: frames {start_frame}-{end_frame}")
-        print(f"    Current pos: X={current_x:.3f}, Y={current_y:.3f}, Z={current_z:.3f}")
-        print(f"    Will move from Y={current_y + start_y_offset:.3f} to Y={current_y:.3f}")
-
-        # START position - pushed back on Y axis only
-        element.location.x = current_x  # Keep X
-        element.location.y = current_y + start_y_offset  # Push back
-        element.location.z = current_z  # Keep Z
-        element.keyframe_insert(data_path='location', frame=start_frame)
-
-        # END position - back to where it was after SVG import
-        element.location.x = current_x  # Keep X
-        element.location.y = current_y  # Return to original Y
-        element.location.z = current_z  # Keep Z
-        element.keyframe_insert(data_path='location', frame=end_frame)
-
-        # Smooth animation
-        if element.animation_data:
-            for fcurve in element.animation_data.action.fcurves:
-                for kf in fcurve.keyframe_points:
-                    kf.interpolation = 'BEZIER'
-                    kf.easing = 'EASE_IN_OUT'
+        if VERBOSE:
+            current_x, current_y, current_z = end_positions[i]
+            print(f"  Element {i}: frames {start_frames[i]}-{end_frames[i]}")
+            print(f"    Current pos: X={current_x:.3f}, Y={current_y:.3f}, Z={current_z:.3f}")
+            print(f"    Will move from Y={start_positions[i, 1]:.3f} to Y={current_y:.3f}")
+
+        # Build the action directly: a single Y fcurve, both keys written at once
+        action = bpy.data.actions.new(name=f"{element.name}Action")
+        fcurve = action.fcurves.new("location", index=1)
+        keyframe_points = fcurve.keyframe_points
+        keyframe_points.add(2)
+        keyframe_points.foreach_set("co", co[i])
+        keyframe_points.foreach_set("interpolation", interpolation)
+        keyframe_points.foreach_set("handle_left_type", handle_type)
+        keyframe_points.foreach_set("handle_right_type", handle_type)
+        fcurve.update()
+
+        element.animation_data_create().action = action
+        element.location = start_positions[i]
 
     # Calculate total frames
-    total_frames = end_frame + 100
+    total_frames = int(end_frames[-1]) + 100
     bpy.context.scene.frame_end = total_frames
 
     print(f"\n✓ Animation setup complete - {total_frames} frames total")
@@ -254,16 +305,22 @@ def animate_sequential(elements):
 
 def create_banja_luka_text():
     """Create BANJA LUKA text at bottom"""
-    bpy.ops.object.text_add(location=(0, 0, -4))
-    text_obj = bpy.context.active_object
-    text_obj.name = "BanjaLuka"
-    text_obj.data.body = "BANJA LUKA"
-    text_obj.data.size = 1.0
-    text_obj.data.align_x = 'CENTER'
-    text_obj.data.align_y = 'CENTER'
-
-    # Convert to mesh
-    bpy.ops.object.convert(target='MESH')
+    text_data = bpy.data.curves.new("BanjaLuka", type='FONT')
+    text_data.body = "BANJA LUKA"
+    text_data.size = 1.0
+    text_data.align_x = 'CENTER'
+    text_data.align_y = 'CENTER'
+    text_curve = bpy.data.objects.new("BanjaLuka", text_data)
+    bpy.context.collection.objects.link(text_curve)
+
+    # Convert to mesh - copy the evaluated mesh instead of running the convert operator
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(text_curve.evaluated_get(depsgraph))
+    bpy.data.objects.remove(text_curve, do_unlink=True)
+    bpy.data.curves.remove(text_data)
+    text_obj = bpy.data.objects.new("BanjaLuka", mesh)
+    text_obj.location = (0, 0, -4)
+    bpy.context.collection.objects.link(text_obj)
 
     # Solidify
     solidify = text_obj.modifiers.new(name="Solidify", type='SOLIDIFY')
@@ -275,7 +332,11 @@ def create_banja_luka_text():
 
 
 def create_logo_material():
-    """Create material for logo elements"""
+    """Create material for logo elements, built once and shared by all of them"""
+    mat = bpy.data.materials.get("LogoMaterial")
+    if mat:
+        return mat
+
     mat = bpy.data.materials.new(name="LogoMaterial")
     mat.use_nodes = True
     mat.metallic = 0.8
@@ -379,23 +440,17 @@ def main():
         print("✗ Failed to import elements")
         return
 
-    # Add materials to elements
-    logo_mat = create_logo_material()
-    for elem in elements:
-        if len(elem.data.materials):
-            elem.data.materials[0] = logo_mat
-        else:
-            elem.data.materials.append(logo_mat)
-
     # Add BANJA LUKA text
     print("\nStep 2: Creating BANJA LUKA text...")
     banja_luka = create_banja_luka_text()
     elements.append(banja_luka)
 
-    if len(banja_luka.data.materials):
-        banja_luka.data.materials[0] = logo_mat
-    else:
-        banja_luka.data.materials.append(logo_mat)
+    # One shared material for the logo and text, assigned once per mesh
+    # (repeated glyphs share a mesh)
+    logo_mat = create_logo_material()
+    for mesh in {elem.data for elem in elements}:
+        mesh.materials.clear()
+        mesh.materials.append(logo_mat)
 
     # Animate elements
     print("\nStep 3: Setting up sequential animation...")
@@ -406,8 +461,10 @@ def main():
     fire_mat = create_fast_fire_material()
 
     for i, elem in enumerate(elements):
-        emitter = create_fire_for_element(elem, i)
-        print(f"  ✓ Fire emitter {i} created (instant, no baking)")
+        emitter = create_fire_for_element(elem, i, fire_mat)
+        if VERBOSE:
+            print(f"  ✓ Fire emitter {i} created (instant, no baking)")
+    print(f"  ✓ {len(elements)} fire emitters created (instant, no baking)")
 
     # Setup scene
     print("\nStep 5: Setting up camera, lights, render...")
@@ -15,6 +15,9 @@ OPCIJA 1 - Iz Blendera (Najlakše):
 OPCIJA 2 - Iz komandne linije:
   blender --background --python BLENDER_ANIMATION.py
 
+  Render ide kroz EEVEE; za Cycles path tracing:
+  ALTER_USE_CYCLES=1 blender --background --python BLENDER_ANIMATION.py
+
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
@@ -22,21 +25,33 @@ import bpy
 import math
 import os
 
+# Cycles path tracing samo na zahtev (ALTER_USE_CYCLES=1), inače EEVEE
+USE_CYCLES = os.environ.get('ALTER_USE_CYCLES') == '1'
+
 
 def clear_scene():
     """Obriši sve iz scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    # Obriši objekte direktno - bez operator konteksta i undo koraka
+    objects = bpy.data.objects
+    for obj in list(objects):
+        objects.remove(obj, do_unlink=True)
+
+    # Obriši materijale, teksture - nekorišćene podatke u jednom rekurzivnom prolazu
+    bpy.data.orphans_purge(do_local_ids=True, do_recursive=True)
+
 
-    # Obriši materijale, teksture
-    for material in bpy.data.materials:
-        bpy.data.materials.remove(material)
-    for texture in bpy.data.textures:
-        bpy.data.textures.remove(texture)
+def link_new_object(name, data, location):
+    """Kreiraj objekat kroz bpy.data i poveži ga u aktivnu kolekciju (bez operatora)"""
+    obj = bpy.data.objects.new(name, data)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
 
 
 def create_logo():
     """Kreiraj 3D text logo"""
+    import numpy as np
+
     print("\n📝 Creating logo...")
 
     bpy.ops.object.text_add(location=(0, 0, 0))
@@ -56,32 +71,32 @@ def create_logo():
     bpy.ops.object.convert(target='MESH')
     logo = bpy.context.active_object
 
-    # Centriraj
-    bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+    # Centriraj - centar granica se oduzima direktno u baferu temena
+    # umesto origin_set operatora
+    mesh = logo.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)
+    co -= (co.min(axis=0) + co.max(axis=0)) * 0.5
+    mesh.vertices.foreach_set('co', co.ravel())
+    mesh.update()
     logo.location = (0, 0, 0)
 
     print("  ✓ Logo created")
     return logo
 
 
-def create_golden_material(logo):
-    """Kreiraj zlatni materijal"""
-    print("\n✨ Creating golden material...")
-
+def build_golden_material():
+    """Napravi zlatni node graph"""
     mat = bpy.data.materials.new(name="GoldenMetal")
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
 
-    # Očisti default nodes
-    nodes.clear()
-
-    # Output node
-    output = nodes.new('ShaderNodeOutputMaterial')
+    # Output i Principled BSDF - koristi postojeće nodove umesto brisanja
+    output = nodes.get('Material Output') or nodes.new('ShaderNodeOutputMaterial')
     output.location = (400, 0)
-
-    # Principled BSDF
-    bsdf = nodes.new('ShaderNodeBsdfPrincipled')
+    bsdf = nodes.get('Principled BSDF') or nodes.new('ShaderNodeBsdfPrincipled')
     bsdf.location = (0, 0)
 
     # Zlatna boja i postavke
@@ -93,11 +108,21 @@ def create_golden_material(logo):
     # Poveži nodes
     links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
 
-    # Dodaj materijal na logo
-    if logo.data.materials:
-        logo.data.materials[0] = mat
-    else:
-        logo.data.materials.append(mat)
+    mat.use_fake_user = True  # Preživi orphans_purge u clear_scene
+
+    return mat
+
+
+def create_golden_material(logo):
+    """Kreiraj zlatni materijal"""
+    print("\n✨ Creating golden material...")
+
+    # Koristi materijal iz prethodnog pokretanja umesto ponovnog pravljenja node grafa
+    mat = bpy.data.materials.get("GoldenMetal") or build_golden_material()
+
+    # Dodaj materijal na logo - jedan slot
+    logo.data.materials.clear()
+    logo.data.materials.append(mat)
 
     print("  ✓ Material applied")
 
@@ -106,9 +131,7 @@ def create_camera(logo):
     """Kreiraj kameru"""
     print("\n📹 Creating camera...")
 
-    bpy.ops.object.camera_add(location=(0, -12, 2.5))
-    camera = bpy.context.active_object
-    camera.name = "MainCamera"
+    camera = link_new_object("MainCamera", bpy.data.cameras.new("MainCamera"), (0, -12, 2.5))
     camera.data.lens = 50
 
     # Fokusiraj na logo
@@ -128,27 +151,33 @@ def animate_logo(logo):
     """Animiraj logo"""
     print("\n🎬 Animating logo...")
 
-    # Početna pozicija (daleko)
-    logo.location = (0, 15, 0)
-    logo.keyframe_insert(data_path="location", frame=1)
-
-    # Krajnja pozicija (blizu)
-    logo.location = (0, -2, 0)
-    logo.keyframe_insert(data_path="location", frame=180)
-
-    # Rotacija
-    logo.rotation_euler = (0, 0, 0)
-    logo.keyframe_insert(data_path="rotation_euler", frame=1)
-
-    logo.rotation_euler = (0.1, 0, math.radians(360))
-    logo.keyframe_insert(data_path="rotation_euler", frame=180)
-
-    # Smooth interpolation
-    for fcurve in logo.animation_data.action.fcurves:
-        for kf in fcurve.keyframe_points:
-            kf.interpolation = 'BEZIER'
-            kf.handle_left_type = 'AUTO_CLAMPED'
-            kf.handle_right_type = 'AUTO_CLAMPED'
+    # Početna i krajnja pozicija (daleko -> blizu), rotacija
+    start_location, end_location = (0, 15, 0), (0, -2, 0)
+    start_rotation, end_rotation = (0, 0, 0), (0.1, 0, math.radians(360))
+
+    # Glatka interpolacija - enum kodovi iz RNA
+    keyframe_props = bpy.types.Keyframe.bl_rna.properties
+    bezier = keyframe_props['interpolation'].enum_items['BEZIER'].value
+    auto_clamped = keyframe_props['handle_left_type'].enum_items['AUTO_CLAMPED'].value
+
+    # Napravi akciju direktno: jedna fcurve po kanalu, oba ključa odjednom
+    action = bpy.data.actions.new(name="AlterLogoAction")
+    channels = (("location", start_location, end_location),
+                ("rotation_euler", start_rotation, end_rotation))
+    for data_path, start, end in channels:
+        for index in range(3):
+            fcurve = action.fcurves.new(data_path, index=index)
+            keyframe_points = fcurve.keyframe_points
+            keyframe_points.add(2)
+            keyframe_points.foreach_set('co', (1, start[index], 180, end[index]))
+            keyframe_points.foreach_set('interpolation', (bezier, bezier))
+            keyframe_points.foreach_set('handle_left_type', (auto_clamped, auto_clamped))
+            keyframe_points.foreach_set('handle_right_type', (auto_clamped, auto_clamped))
+            fcurve.update()
+
+    logo.animation_data_create().action = action
+    logo.location = start_location
+    logo.rotation_euler = start_rotation
 
     print("  ✓ Animation keyframes set")
 
@@ -157,23 +186,22 @@ def create_lighting():
     """Kreiraj osvetljenje"""
     print("\n💡 Creating lights...")
 
+    lights = bpy.data.lights
+
     # Key light
-    bpy.ops.object.light_add(type='AREA', location=(6, -8, 8))
-    key = bpy.context.active_object
+    key = link_new_object("KeyLight", lights.new("KeyLight", 'AREA'), (6, -8, 8))
     key.data.energy = 600
     key.data.size = 5
     key.data.color = (1.0, 0.95, 0.9)
 
     # Fill light
-    bpy.ops.object.light_add(type='AREA', location=(-5, -6, 4))
-    fill = bpy.context.active_object
+    fill = link_new_object("FillLight", lights.new("FillLight", 'AREA'), (-5, -6, 4))
     fill.data.energy = 250
     fill.data.size = 4
     fill.data.color = (0.9, 0.95, 1.0)
 
     # Rim light
-    bpy.ops.object.light_add(type='SPOT', location=(0, 10, 5))
-    rim = bpy.context.active_object
+    rim = link_new_object("RimLight", lights.new("RimLight", 'SPOT'), (0, 10, 5))
     rim.data.energy = 400
     rim.data.spot_size = math.radians(50)
 
@@ -203,12 +231,33 @@ def setup_render():
     scene.frame_end = 180  # 6 sekundi na 30fps
     scene.render.fps = 30
 
-    # Render engine
-    scene.render.engine = 'CYCLES'
-    scene.cycles.samples = 128  # Srednji kvalitet
+    # Render engine - EEVEE rasterizuje zlatni/emisioni izgled za deo
+    # vremena koje Cycles troši po frejmu
+    if USE_CYCLES:
+        scene.render.engine = 'CYCLES'
+    else:
+        try:
+            scene.render.engine = 'BLENDER_EEVEE_NEXT'
+        except TypeError:
+            scene.render.engine = 'BLENDER_EEVEE'  # Ime pre 4.2 i od 4.5
+
+        eevee = scene.eevee
+        eevee.taa_render_samples = 32
+        if hasattr(eevee, 'use_raytracing'):
+            eevee.use_raytracing = True  # EEVEE Next refleksije
+        if hasattr(eevee, 'use_bloom'):
+            eevee.use_bloom = True  # Stari EEVEE sjaj
+
+    # Cycles postavke
+    scene.cycles.samples = 64  # Gornja granica - adaptive sampling staje ranije
     scene.cycles.use_denoising = True
     scene.cycles.denoiser = 'OPENIMAGEDENOISE'
 
+    # Adaptive sampling - svetla emisiona/metalna scena brzo konvergira
+    scene.cycles.use_adaptive_sampling = True
+    scene.cycles.adaptive_threshold = 0.05
+    scene.cycles.adaptive_min_samples = 16
+
     # GPU rendering
     scene.cycles.device = 'GPU'
 
@@ -239,6 +288,12 @@ def main():
     print(" " * 20 + "ALTER LOGO ANIMATION SETUP")
     print("=" * 75)
 
+    # Bez undo koraka tokom setup-a - svaki operator bi inače sačuvao
+    # snimak scene; vraća se u finally bloku ispod
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+
     try:
         # 1. Očisti scenu
         print("\n[1/6] Clearing scene...")
@@ -282,7 +337,7 @@ def main():
         print(f"\n📁 Saved to: {save_path}")
         print(f"🎬 Frames: 180 (6 seconds at 30fps)")
         print(f"📐 Resolution: 1920x1080")
-        print(f"🎨 Render engine: Cycles (128 samples)")
+        print(f"🎨 Render engine: {'Cycles (adaptive, max 64 samples)' if USE_CYCLES else 'EEVEE (32 samples)'}")
         print()
         print("▶️  To preview:")
         print("   • Press SPACEBAR in viewport")
@@ -305,6 +360,9 @@ def main():
         traceback.print_exc()
         raise
 
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # POKRENI ODMAH
@@ -40,23 +40,35 @@ import math
 
 print("Creating simple logo animation...")
 
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete()
+# Clear scene - batched removal instead of select_all + delete operators
+bpy.data.batch_remove(ids=list(bpy.data.objects))
+orphans = [
+    block
+    for blocks in (bpy.data.meshes, bpy.data.curves, bpy.data.materials,
+                   bpy.data.textures, bpy.data.images)
+    for block in blocks
+    if block.users == 0
+]
+bpy.data.batch_remove(ids=orphans)
 
 # Create text logo
-bpy.ops.object.text_add(location=(0, 0, 0))
-text_obj = bpy.context.active_object
-text_obj.data.body = "ALTER"
-text_obj.data.align_x = 'CENTER'
-text_obj.data.align_y = 'CENTER'
-text_obj.data.size = 2.0
-text_obj.data.extrude = 0.3
-text_obj.data.bevel_depth = 0.05
-
-# Convert to mesh
-bpy.ops.object.convert(target='MESH')
-logo = bpy.context.active_object
+text_data = bpy.data.curves.new("ALTER", type='FONT')
+text_data.body = "ALTER"
+text_data.align_x = 'CENTER'
+text_data.align_y = 'CENTER'
+text_data.size = 2.0
+text_data.extrude = 0.3
+text_data.bevel_depth = 0.05
+text_obj = bpy.data.objects.new("ALTER", text_data)
+bpy.context.collection.objects.link(text_obj)
+
+# Convert to mesh - copy the evaluated mesh instead of running the convert operator
+depsgraph = bpy.context.evaluated_depsgraph_get()
+mesh = bpy.data.meshes.new_from_object(text_obj.evaluated_get(depsgraph))
+bpy.data.objects.remove(text_obj, do_unlink=True)
+bpy.data.curves.remove(text_data)
+logo = bpy.data.objects.new("ALTER", mesh)
+bpy.context.collection.objects.link(logo)
 
 # Create golden material
 mat = bpy.data.materials.new(name="Gold")
@@ -79,17 +91,20 @@ camera = bpy.context.active_object
 camera.rotation_euler = (math.radians(80), 0, 0)
 bpy.context.scene.camera = camera
 
-# Animate logo
-logo.location = (0, 10, 0)
-logo.keyframe_insert(data_path="location", frame=1)
-logo.location = (0, 0, 0)
-logo.keyframe_insert(data_path="location", frame=120)
-
-# Animate rotation
-logo.rotation_euler = (0, 0, 0)
-logo.keyframe_insert(data_path="rotation_euler", frame=1)
-logo.rotation_euler = (0, 0, math.radians(360))
-logo.keyframe_insert(data_path="rotation_euler", frame=120)
+# Animate logo location and rotation - allocate each fcurve's keys at once
+# and write them in one call instead of a keyframe_insert per key
+action = bpy.data.actions.new("LogoAction")
+keys = {
+    "location": ((0, 10, 0), (0, 0, 0)),
+    "rotation_euler": ((0, 0, 0), (0, 0, math.radians(360))),
+}
+for data_path, (start, end) in keys.items():
+    for index in range(3):
+        fcurve = action.fcurves.new(data_path=data_path, index=index)
+        fcurve.keyframe_points.add(2)
+        fcurve.keyframe_points.foreach_set("co", (1, start[index], 120, end[index]))
+        fcurve.update()
+logo.animation_data_create().action = action
 
 # Add light
 bpy.ops.object.light_add(type='SUN', location=(5, -5, 10))
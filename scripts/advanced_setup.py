@@ -44,6 +44,10 @@ class AdvancedAnimationSetup(LogoAnimationSetup):
             self.fire_end_frame = timing['fire_end_frame']
             print(f"  Applied timing: {timing['description']}")
 
+        # Render preset volume resolution caps the fitted fire domain's grid
+        if 'render' in self.presets:
+            self.fire_resolution = self.presets['render']['volume_resolution']
+
     def create_golden_material(self):
         """Create material with color preset"""
         mat = super().create_golden_material()
@@ -140,9 +144,9 @@ class AdvancedAnimationSetup(LogoAnimationSetup):
 
             print(f"  Applied lighting: {light_config['description']}")
 
-    def configure_render_settings(self):
+    def configure_quality_render_settings(self):
         """Configure render with quality preset"""
-        super().configure_render_settings()
+        super().configure_quality_render_settings()
 
         if 'render' in self.presets:
             render_config = self.presets['render']
@@ -154,11 +158,6 @@ class AdvancedAnimationSetup(LogoAnimationSetup):
             scene.render.resolution_percentage = render_config['resolution_percentage']
             scene.cycles.use_denoising = render_config['use_denoising']
 
-            # Update domain resolution
-            if self.fire_domain:
-                self.fire_domain.modifiers["Fluid"].domain_settings.resolution_max = \
-                    render_config['volume_resolution']
-
             print(f"  Applied render: {render_config['description']}")
 
         # Apply FPS from timing preset
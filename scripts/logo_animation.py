@@ -6,7 +6,143 @@ Professional 3D animation setup for logo reveal with fire effects
 import bpy
 import os
 import math
-from mathutils import Vector
+
+# Pre-built materials are appended from library files instead of being
+# rebuilt node by node. Each file name carries a hash of its builder's code,
+# so editing a build_*_material method invalidates that cache automatically.
+MATERIAL_LIBRARY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets"
+)
+
+# Edge length of the original cubic fire domain; fluid resolutions (including
+# the render presets' volume_resolution) were tuned against it, so a voxel
+# size is this divided by the resolution
+FIRE_REFERENCE_DOMAIN = 12.0
+
+
+def link_new_object(name, data):
+    """Create an object for data and link it into the active collection"""
+    obj = bpy.data.objects.new(name, data)
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def torus_geometry(major_radius, minor_radius, major_segments=48, minor_segments=12):
+    """Compute torus vertices and quad faces in the XY plane (no bpy access)"""
+    import numpy as np
+    u = np.linspace(0, 2 * np.pi, major_segments, endpoint=False)
+    v = np.linspace(0, 2 * np.pi, minor_segments, endpoint=False)
+    u, v = np.meshgrid(u, v, indexing='ij')
+    ring_radius = major_radius + minor_radius * np.cos(v)
+    verts = np.stack(
+        [ring_radius * np.cos(u), ring_radius * np.sin(u), minor_radius * np.sin(v)], axis=-1
+    ).reshape(-1, 3).astype(np.float32)
+
+    # Quad (i, j) -> (i+1, j) -> (i+1, j+1) -> (i, j+1), wrapping around both rings
+    i = np.arange(major_segments)[:, None]
+    j = np.arange(minor_segments)[None, :]
+    next_i = (i + 1) % major_segments
+    next_j = (j + 1) % minor_segments
+    faces = np.stack(
+        [i * minor_segments + j, next_i * minor_segments + j,
+         next_i * minor_segments + next_j, i * minor_segments + next_j], axis=-1
+    ).reshape(-1, 4).astype(np.int32)
+
+    return verts, faces
+
+
+def box_geometry(size):
+    """Compute vertices and outward-facing quads of a box centered on the origin"""
+    import numpy as np
+    corners = np.array(
+        [(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)],
+        dtype=np.float32
+    )
+    verts = corners * np.asarray(size, dtype=np.float32)
+    faces = np.array([
+        (0, 1, 3, 2), (4, 6, 7, 5),  # -X, +X
+        (0, 4, 5, 1), (2, 3, 7, 6),  # -Y, +Y
+        (0, 2, 6, 4), (1, 5, 7, 3),  # -Z, +Z
+    ], dtype=np.int32)
+    return verts, faces
+
+
+def create_mesh(name, verts, faces):
+    """Build a mesh datablock from vertex and face arrays without operators"""
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts.tolist(), [], faces.tolist())
+    mesh.update()
+    return mesh
+
+
+def material_library_path(name, builder):
+    """Library file for a material keyed by its builder's source, or None if unavailable"""
+    import hashlib
+    import inspect
+    try:
+        source = inspect.getsource(builder)
+    except (OSError, TypeError):
+        return None  # Source not on disk - always build, never cache
+    digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+    return os.path.join(MATERIAL_LIBRARY_DIR, f"materials_{name}_{digest}.blend")
+
+
+def load_library_material(library, name):
+    """Append a pre-built material from the asset library, or return None"""
+    if library is None or not os.path.exists(library):
+        return None
+
+    with bpy.data.libraries.load(library, link=False) as (data_from, data_to):
+        data_to.materials = [name] if name in data_from.materials else []
+
+    if not data_to.materials:
+        return None
+
+    # The library keeps a fake user so the assets survive on disk; the scene copy doesn't need one
+    mat = data_to.materials[0]
+    mat.use_fake_user = False
+    return mat
+
+
+def save_library_material(library, mat):
+    """Write a freshly built material to the asset library, replacing stale versions"""
+    import glob
+    if library is None:
+        return
+
+    os.makedirs(MATERIAL_LIBRARY_DIR, exist_ok=True)
+    for stale in glob.glob(os.path.join(MATERIAL_LIBRARY_DIR, f"materials_{mat.name}_*.blend")):
+        if stale != library:
+            os.remove(stale)
+    bpy.data.libraries.write(library, {mat}, fake_user=True)
+
+
+def add_fcurve_keyframes(action, data_path, index, frames, values):
+    """Create an fcurve and write all its keyframes in one bulk pass"""
+    import numpy as np
+    count = len(frames)
+    fcurve = action.fcurves.new(data_path=data_path, index=index)
+
+    # Allocate every key at once instead of one keyframe_insert() per key
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.add(count)
+
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    keyframe_points.foreach_set('co', co)
+
+    # Smooth BEZIER interpolation with AUTO_CLAMPED handles
+    keyframe_props = bpy.types.Keyframe.bl_rna.properties
+    bezier = keyframe_props['interpolation'].enum_items['BEZIER'].value
+    auto_clamped = keyframe_props['handle_left_type'].enum_items['AUTO_CLAMPED'].value
+    keyframe_points.foreach_set('interpolation', np.full(count, bezier, dtype=np.int32))
+    keyframe_points.foreach_set('handle_left_type', np.full(count, auto_clamped, dtype=np.int32))
+    keyframe_points.foreach_set('handle_right_type', np.full(count, auto_clamped, dtype=np.int32))
+
+    # Recalculate handles once all keys are in place
+    fcurve.update()
+    return fcurve
 
 
 class LogoAnimationSetup:
@@ -20,29 +156,34 @@ class LogoAnimationSetup:
         self.fire_domain = None
         self.total_frames = 300
         self.fire_end_frame = 200
+        self.fire_tail_frames = 20  # Let residual smoke dissipate after the emitter stops
+        # Upper bound on the domain resolution; the fitted domain keeps the
+        # original 12-unit domain's voxel size up to this many cells
+        self.fire_resolution = 256
+        self.fire_headroom = 6.0  # Room above the emitter path for rising flames
+        self.high_quality = False
+        self.use_cycles = os.environ.get('ALTER_USE_CYCLES') == '1'
+        self.emitter_major_radius = 3.5
+        self.emitter_minor_radius = 0.8
 
     def clear_scene(self):
         """Remove default objects from scene"""
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-
-        # Clear orphan data
-        for block in bpy.data.meshes:
-            if block.users == 0:
-                bpy.data.meshes.remove(block)
-        for block in bpy.data.materials:
-            if block.users == 0:
-                bpy.data.materials.remove(block)
-        for block in bpy.data.textures:
-            if block.users == 0:
-                bpy.data.textures.remove(block)
-        for block in bpy.data.images:
-            if block.users == 0:
-                bpy.data.images.remove(block)
+        # Remove objects directly - no operator context/undo overhead
+        objects = bpy.data.objects
+        for obj in list(objects):
+            objects.remove(obj, do_unlink=True)
+
+        # Clear orphan data (meshes, materials, textures, images) in one pass
+        bpy.data.orphans_purge(do_recursive=True)
 
     def import_svg_logo(self):
         """Import SVG logo and convert to mesh with robust error handling"""
         import os
+        import numpy as np
+
+        context = bpy.context
+        data = bpy.data
+        ops_object = bpy.ops.object
 
         print(f"  Importing SVG from: {self.svg_path}")
 
@@ -51,10 +192,7 @@ class LogoAnimationSetup:
             raise FileNotFoundError(f"SVG file not found: {self.svg_path}")
 
         # Get existing objects before import
-        existing_objects = set(bpy.context.scene.objects)
-
-        # Deselect all first
-        bpy.ops.object.select_all(action='DESELECT')
+        existing_objects = set(context.scene.objects)
 
         try:
             # Import SVG
@@ -65,7 +203,7 @@ class LogoAnimationSetup:
                 raise Exception("SVG import did not complete successfully")
 
             # Get newly imported objects
-            new_objects = set(bpy.context.scene.objects) - existing_objects
+            new_objects = set(context.scene.objects) - existing_objects
             imported_curves = [obj for obj in new_objects if obj.type == 'CURVE']
 
             if not imported_curves:
@@ -74,27 +212,22 @@ class LogoAnimationSetup:
 
             print(f"  Successfully imported {len(imported_curves)} curve object(s)")
 
-            # Select all imported curves
-            for obj in imported_curves:
-                obj.select_set(True)
-
-            # Set first as active
-            bpy.context.view_layer.objects.active = imported_curves[0]
-
-            # Join all curves if multiple
+            # Join all curves into the first one - context override instead
+            # of changing the selection and active object (Blender 3.2+)
+            logo_curve = imported_curves[0]
             if len(imported_curves) > 1:
                 print(f"  Joining {len(imported_curves)} curves into one object...")
-                bpy.ops.object.join()
-
-            logo_curve = bpy.context.active_object
+                with context.temp_override(active_object=logo_curve,
+                                           selected_editable_objects=imported_curves):
+                    ops_object.join()
 
         except Exception as e:
             print(f"  SVG import failed: {str(e)}")
             print("  Creating fallback 3D text logo...")
 
             # Create fallback text logo
-            bpy.ops.object.text_add(location=(0, 0, 0))
-            logo_curve = bpy.context.active_object
+            ops_object.text_add(location=(0, 0, 0))
+            logo_curve = context.active_object
             logo_curve.data.body = "ALTER"
             logo_curve.data.align_x = 'CENTER'
             logo_curve.data.align_y = 'CENTER'
@@ -103,7 +236,7 @@ class LogoAnimationSetup:
             # Add some depth
             logo_curve.data.extrude = 0.2
             logo_curve.data.bevel_depth = 0.05
-            logo_curve.data.bevel_resolution = 3
+            logo_curve.data.bevel_resolution = 1
 
         # Verify we have an object
         if logo_curve is None:
@@ -118,25 +251,37 @@ class LogoAnimationSetup:
             try:
                 logo_curve.data.extrude = 0.15
                 logo_curve.data.bevel_depth = 0.02
-                logo_curve.data.bevel_resolution = 4
+                logo_curve.data.bevel_resolution = 1
                 print("  Added extrusion and bevel")
             except:
                 print("  Note: Could not add extrusion (may already be set)")
 
         # Convert to mesh for better material control
+        # (one evaluated-mesh extraction instead of convert/origin_set/transform_apply)
         print("  Converting to mesh...")
-        bpy.ops.object.convert(target='MESH')
+        depsgraph = context.evaluated_depsgraph_get()
+        mesh = data.meshes.new_from_object(logo_curve.evaluated_get(depsgraph))
 
-        # Update reference (convert changes the object)
-        logo_mesh = bpy.context.active_object
-        logo_mesh.name = "AlterLogo"
+        # Replace the curve object with a mesh object in the same collections
+        collections = list(logo_curve.users_collection) or [context.scene.collection]
+        curve_data = logo_curve.data
+        data.objects.remove(logo_curve, do_unlink=True)
+        data.curves.remove(curve_data)
 
-        # Center and scale
+        mesh.name = "AlterLogo"
+        logo_mesh = data.objects.new("AlterLogo", mesh)
+        for collection in collections:
+            collection.objects.link(logo_mesh)
+
+        # Center on bounding box and scale directly in the vertex buffer
         print("  Centering and scaling...")
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-        logo_mesh.location = (0, 0, 0)
-        logo_mesh.scale = (2.5, 2.5, 2.5)
-        bpy.ops.object.transform_apply(scale=True)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+        co = co.reshape(-1, 3)
+        center = (co.min(axis=0) + co.max(axis=0)) * 0.5
+        co = (co - center) * 2.5
+        mesh.vertices.foreach_set('co', co.ravel())
+        mesh.update()
 
         self.logo_obj = logo_mesh
         print(f"  ✓ Logo ready: {logo_mesh.name}")
@@ -145,6 +290,23 @@ class LogoAnimationSetup:
 
     def create_golden_material(self):
         """Create photorealistic golden material with reflections"""
+        library = material_library_path("GoldenMetal", type(self).build_golden_material)
+        mat = load_library_material(library, "GoldenMetal")
+        if mat is None:
+            # Cache the untouched build - subclasses tint the material after this returns
+            mat = self.build_golden_material()
+            save_library_material(library, mat)
+
+        # Assign material to logo
+        if self.logo_obj.data.materials:
+            self.logo_obj.data.materials[0] = mat
+        else:
+            self.logo_obj.data.materials.append(mat)
+
+        return mat
+
+    def build_golden_material(self):
+        """Build the golden material node tree"""
         mat = bpy.data.materials.new(name="GoldenMetal")
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
@@ -196,27 +358,20 @@ class LogoAnimationSetup:
         links.new(emission.outputs['Emission'], mix.inputs[2])
         links.new(mix.outputs['Shader'], output.inputs['Surface'])
 
-        # Assign material to logo
-        if self.logo_obj.data.materials:
-            self.logo_obj.data.materials[0] = mat
-        else:
-            self.logo_obj.data.materials.append(mat)
-
         return mat
 
     def setup_camera(self):
         """Setup and animate camera"""
         # Create camera
-        bpy.ops.object.camera_add(location=(0, -25, 2))
-        self.camera = bpy.context.active_object
-        self.camera.name = "MainCamera"
+        self.camera = link_new_object("MainCamera", bpy.data.cameras.new("MainCamera"))
+        self.camera.location = (0, -25, 2)
 
         # Camera settings
         self.camera.data.lens = 50
         self.camera.data.sensor_width = 36
-        self.camera.data.dof.use_dof = True
-        self.camera.data.dof.aperture_fstop = 2.8
-        self.camera.data.dof.focus_distance = 25
+        # No DOF: at 25 units the blur circle on the logo is sub-pixel,
+        # but aperture sampling still slows convergence
+        self.camera.data.dof.use_dof = False
 
         # Point camera at logo
         constraint = self.camera.constraints.new(type='TRACK_TO')
@@ -231,52 +386,82 @@ class LogoAnimationSetup:
 
     def animate_logo(self):
         """Animate logo moving towards camera"""
+        from mathutils import Vector
+
         # Starting position (far from camera)
         start_pos = Vector((0, 15, 0))
         # End position (close to camera)
         end_pos = Vector((0, -5, 0))
 
-        # Set initial position
-        self.logo_obj.location = start_pos
-        self.logo_obj.keyframe_insert(data_path="location", frame=1)
-
-        # Set end position
-        self.logo_obj.location = end_pos
-        self.logo_obj.keyframe_insert(data_path="location", frame=self.total_frames)
-
-        # Add smooth interpolation
-        for fcurve in self.logo_obj.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = 'BEZIER'
-                keyframe.handle_left_type = 'AUTO_CLAMPED'
-                keyframe.handle_right_type = 'AUTO_CLAMPED'
+        # Subtle rotation for dynamic effect
+        start_rot = Vector((0, 0, 0))
+        end_rot = Vector((0.1, 0, math.radians(360)))
 
-        # Add subtle rotation for dynamic effect
-        self.logo_obj.rotation_euler = (0, 0, 0)
-        self.logo_obj.keyframe_insert(data_path="rotation_euler", frame=1)
+        # Build the action directly: one fcurve per channel, both keys written at once
+        frames = (1, self.total_frames)
+        action = bpy.data.actions.new(name="AlterLogoAction")
+        for axis in range(3):
+            add_fcurve_keyframes(action, "location", axis, frames,
+                                 (start_pos[axis], end_pos[axis]))
+            add_fcurve_keyframes(action, "rotation_euler", axis, frames,
+                                 (start_rot[axis], end_rot[axis]))
 
-        self.logo_obj.rotation_euler = (0.1, 0, math.radians(360))
-        self.logo_obj.keyframe_insert(data_path="rotation_euler", frame=self.total_frames)
+        self.logo_obj.animation_data_create().action = action
+        self.logo_obj.location = start_pos
+        self.logo_obj.rotation_euler = start_rot
 
     def create_fire_simulation(self):
         """Create realistic fire simulation around logo"""
+        import numpy as np
+
+        # Emitter torus dimensions
+        major_radius = self.emitter_major_radius
+        minor_radius = self.emitter_minor_radius
+
+        # Fit the domain to the region the emitter sweeps while it burns -
+        # the solver works on every voxel, so empty domain space is wasted bake time
+        reach = major_radius + minor_radius
+        burn_frames = range(1, self.fire_end_frame + 1)
+        positions = np.tile(np.asarray(self.logo_obj.location, dtype=np.float32), (len(burn_frames), 1))
+        for fcurve in self.logo_obj.animation_data.action.fcurves:
+            if fcurve.data_path == "location":
+                positions[:, fcurve.array_index] = [fcurve.evaluate(frame) for frame in burn_frames]
+        low = positions.min(axis=0) - reach
+        high = positions.max(axis=0) + reach
+        high[2] += self.fire_headroom  # Buoyant flames rise along +Z
+        domain_size = (high - low) * 1.1
+
         # Create smoke domain
-        bpy.ops.mesh.primitive_cube_add(size=12, location=(0, 5, 0))
-        domain = bpy.context.active_object
-        domain.name = "FireDomain"
+        domain = link_new_object("FireDomain", create_mesh("FireDomain", *box_geometry(domain_size)))
+        domain.location = (low + high) / 2
         self.fire_domain = domain
 
         # Add smoke modifier
-        bpy.ops.object.modifier_add(type='FLUID')
+        domain.modifiers.new(name="Fluid", type='FLUID')
         domain.modifiers["Fluid"].fluid_type = 'DOMAIN'
         domain_settings = domain.modifiers["Fluid"].domain_settings
 
         # Configure domain for fire
         domain_settings.domain_type = 'GAS'
-        domain_settings.resolution_max = 256
-        domain_settings.use_noise = True
-        domain_settings.noise_scale = 2
-        domain_settings.noise_strength = 1.5
+        # Resolution follows from the reference cell size along the longest
+        # domain axis, capped so a long flight path never grows the grid
+        cell_size = FIRE_REFERENCE_DOMAIN / self.fire_resolution
+        domain_settings.resolution_max = min(
+            math.ceil(domain_size.max() / cell_size), self.fire_resolution
+        )
+
+        # The domain spans the whole flight path, but fire only fills the part
+        # around the emitter - simulate just the cells near active fire
+        domain_settings.use_adaptive_domain = True
+        domain_settings.adapt_margin = 4
+        domain_settings.adapt_threshold = 0.02
+
+        # Wavelet noise upres costs ~noise_scale^3 on top of the base grid -
+        # only worth it for high quality renders
+        domain_settings.use_noise = self.high_quality
+        if self.high_quality:
+            domain_settings.noise_scale = 2
+            domain_settings.noise_strength = 1.5
 
         # Enable fire
         domain_settings.use_fire = True
@@ -295,26 +480,24 @@ class LogoAnimationSetup:
 
         # Cache settings
         domain_settings.cache_frame_start = 1
-        domain_settings.cache_frame_end = self.total_frames
+        # Nothing is emitted after fire_end_frame, so stop the bake shortly after
+        domain_settings.cache_frame_end = min(self.fire_end_frame + self.fire_tail_frames, self.total_frames)
         domain_settings.cache_type = 'MODULAR'
 
-        # Create fire emitter (torus around logo)
-        bpy.ops.mesh.primitive_torus_add(
-            align='WORLD',
-            location=(0, 0, 0),
-            rotation=(math.radians(90), 0, 0),
-            major_radius=3.5,
-            minor_radius=0.8
-        )
-        emitter = bpy.context.active_object
-        emitter.name = "FireEmitter"
+        # Create fire emitter (torus around logo). Low-poly: the emitter is
+        # hidden and only voxelized into the domain, where detail below the
+        # cell size is lost anyway
+        verts, faces = torus_geometry(major_radius, minor_radius,
+                                      major_segments=8, minor_segments=6)
+        emitter = link_new_object("FireEmitter", create_mesh("FireEmitter", verts, faces))
+        emitter.rotation_euler = (math.radians(90), 0, 0)
 
         # Parent emitter to logo
         emitter.parent = self.logo_obj
         emitter.matrix_parent_inverse = self.logo_obj.matrix_world.inverted()
 
         # Add fluid modifier to emitter
-        bpy.ops.object.modifier_add(type='FLUID')
+        emitter.modifiers.new(name="Fluid", type='FLUID')
         emitter.modifiers["Fluid"].fluid_type = 'FLOW'
         flow_settings = emitter.modifiers["Fluid"].flow_settings
 
@@ -330,21 +513,17 @@ class LogoAnimationSetup:
         flow_settings.temperature = 3.0
         flow_settings.fuel_amount = 2.0
 
-        # Animate fire strength (fade out)
-        flow_settings.density = 1.0
-        emitter.modifiers["Fluid"].flow_settings.keyframe_insert(
-            data_path="density", frame=1
-        )
-
+        # Animate fire strength (fade out) - one prebuilt fcurve on the emitter
         flow_settings.density = 1.0
-        emitter.modifiers["Fluid"].flow_settings.keyframe_insert(
-            data_path="density", frame=self.fire_end_frame - 30
-        )
-
-        flow_settings.density = 0.0
-        emitter.modifiers["Fluid"].flow_settings.keyframe_insert(
-            data_path="density", frame=self.fire_end_frame
+        fire_action = bpy.data.actions.new(name="FireEmitterAction")
+        add_fcurve_keyframes(
+            fire_action,
+            flow_settings.path_from_id("density"),
+            0,
+            (1, self.fire_end_frame - 30, self.fire_end_frame),
+            (1.0, 1.0, 0.0)
         )
+        emitter.animation_data_create().action = fire_action
 
         # Create fire material for domain
         self.create_fire_material()
@@ -356,6 +535,22 @@ class LogoAnimationSetup:
 
     def create_fire_material(self):
         """Create realistic fire and smoke material"""
+        library = material_library_path("FireMaterial", type(self).build_fire_material)
+        mat = load_library_material(library, "FireMaterial")
+        if mat is None:
+            mat = self.build_fire_material()
+            save_library_material(library, mat)
+
+        # Assign to domain
+        if self.fire_domain.data.materials:
+            self.fire_domain.data.materials[0] = mat
+        else:
+            self.fire_domain.data.materials.append(mat)
+
+        return mat
+
+    def build_fire_material(self):
+        """Build the fire and smoke volume node tree"""
         mat = bpy.data.materials.new(name="FireMaterial")
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
@@ -425,20 +620,15 @@ class LogoAnimationSetup:
         links.new(volume_scatter.outputs['Volume'], add_shader.inputs[1])
         links.new(add_shader.outputs['Shader'], output.inputs['Volume'])
 
-        # Assign to domain
-        if self.fire_domain.data.materials:
-            self.fire_domain.data.materials[0] = mat
-        else:
-            self.fire_domain.data.materials.append(mat)
-
         return mat
 
     def setup_lighting(self):
         """Create professional lighting setup"""
+        lights = bpy.data.lights
+
         # Key light
-        bpy.ops.object.light_add(type='AREA', location=(5, -10, 8))
-        key_light = bpy.context.active_object
-        key_light.name = "KeyLight"
+        key_light = link_new_object("KeyLight", lights.new("KeyLight", type='AREA'))
+        key_light.location = (5, -10, 8)
         key_light.data.energy = 500
         key_light.data.size = 5
         key_light.data.color = (1.0, 0.95, 0.9)
@@ -450,17 +640,15 @@ class LogoAnimationSetup:
         constraint.up_axis = 'UP_Y'
 
         # Fill light
-        bpy.ops.object.light_add(type='AREA', location=(-5, -8, 4))
-        fill_light = bpy.context.active_object
-        fill_light.name = "FillLight"
+        fill_light = link_new_object("FillLight", lights.new("FillLight", type='AREA'))
+        fill_light.location = (-5, -8, 4)
         fill_light.data.energy = 200
         fill_light.data.size = 4
         fill_light.data.color = (0.9, 0.95, 1.0)
 
         # Rim light
-        bpy.ops.object.light_add(type='SPOT', location=(0, 10, 5))
-        rim_light = bpy.context.active_object
-        rim_light.name = "RimLight"
+        rim_light = link_new_object("RimLight", lights.new("RimLight", type='SPOT'))
+        rim_light.location = (0, 10, 5)
         rim_light.data.energy = 300
         rim_light.data.color = (1.0, 0.8, 0.5)
         rim_light.data.spot_size = math.radians(60)
@@ -481,8 +669,9 @@ class LogoAnimationSetup:
 
     def setup_compositing(self):
         """Setup compositing for bloom and color grading"""
-        bpy.context.scene.use_nodes = True
-        tree = bpy.context.scene.node_tree
+        scene = bpy.context.scene
+        scene.use_nodes = True
+        tree = scene.node_tree
         nodes = tree.nodes
         links = tree.links
 
@@ -533,8 +722,28 @@ class LogoAnimationSetup:
         links.new(color_correct.outputs['Image'], lens.inputs['Image'])
         links.new(lens.outputs['Image'], composite.inputs['Image'])
 
-    def configure_render_settings(self):
-        """Configure high-quality render settings"""
+    def enable_optix_devices(self):
+        """Select the OptiX backend and enable its devices, return False if none exist"""
+        try:
+            prefs = bpy.context.preferences.addons['cycles'].preferences
+        except KeyError:
+            return False
+
+        # OptiX must be compiled into this build and have devices on this host;
+        # otherwise assigning it raises and the user's preferences stay untouched
+        compiled = {t[0] for t in prefs.get_device_types(bpy.context)}
+        if 'OPTIX' not in compiled or not prefs.get_devices_for_type('OPTIX'):
+            return False
+
+        prefs.compute_device_type = 'OPTIX'
+        found = False
+        for device in prefs.devices:
+            device.use = device.type == 'OPTIX'
+            found = found or device.use
+        return found
+
+    def configure_basic_render_settings(self):
+        """Configure frame range, frame rate and output format"""
         scene = bpy.context.scene
 
         # Set frame range
@@ -545,20 +754,73 @@ class LogoAnimationSetup:
         # Frame rate
         scene.render.fps = 30
 
-        # Render engine
-        scene.render.engine = 'CYCLES'
+        # Output settings
+        scene.render.resolution_x = 1920
+        scene.render.resolution_y = 1080
+        scene.render.resolution_percentage = 100
+
+        # Output format
+        scene.render.image_settings.file_format = 'FFMPEG'
+        scene.render.ffmpeg.format = 'MPEG4'
+        scene.render.ffmpeg.codec = 'H264'
+        scene.render.ffmpeg.constant_rate_factor = 'HIGH'
+        scene.render.ffmpeg.ffmpeg_preset = 'BEST'
+        scene.render.ffmpeg.audio_codec = 'NONE'
+
+        # Set output path
+        scene.render.filepath = os.path.join(self.output_path, 'alter_logo_animation_')
+
+    def configure_quality_render_settings(self):
+        """Configure high-quality render settings, applied last so setup runs without them"""
+        scene = bpy.context.scene
+
+        # Render engine - EEVEE raymarches the fire volume in real time,
+        # Cycles path tracing is kept for hero renders (ALTER_USE_CYCLES=1)
+        if self.use_cycles:
+            scene.render.engine = 'CYCLES'
+        else:
+            try:
+                scene.render.engine = 'BLENDER_EEVEE_NEXT'
+            except TypeError:
+                scene.render.engine = 'BLENDER_EEVEE'  # Name used before 4.2 and since 4.5
+
+            eevee = scene.eevee
+            eevee.taa_render_samples = 64
+            eevee.volumetric_samples = 64
+            eevee.use_volumetric_shadows = True
+
         cycles = scene.cycles
 
         # Quality settings
         cycles.samples = 256
         cycles.preview_samples = 64
         cycles.use_denoising = True
-        cycles.denoiser = 'OPENIMAGEDENOISE'
 
-        # Performance
+        # Performance - OptiX uses the RT cores for BVH traversal and the
+        # tensor cores for denoising on NVIDIA cards
+        # Device preferences are only touched for Cycles renders
         cycles.device = 'GPU'
+        if self.use_cycles and self.enable_optix_devices():
+            cycles.denoiser = 'OPTIX'
+            try:
+                cycles.denoising_use_gpu = True  # Blender 4.1+
+            except AttributeError:
+                pass
+        else:
+            cycles.denoiser = 'OPENIMAGEDENOISE'
+
+        # Adaptive sampling - converged pixels stop early, samples is only a cap
         cycles.use_adaptive_sampling = True
         cycles.adaptive_threshold = 0.01
+        cycles.adaptive_min_samples = 16
+
+        # Large tiles keep the GPU saturated
+        cycles.use_auto_tile = True
+        cycles.tile_size = 2048
+
+        # Keep BVH and compiled shaders resident between animation frames
+        scene.render.use_persistent_data = True
+        cycles.debug_use_spatial_splits = False
 
         # Light paths
         cycles.max_bounces = 12
@@ -581,28 +843,12 @@ class LogoAnimationSetup:
         scene.render.use_motion_blur = True
         scene.render.motion_blur_shutter = 0.5
 
-        # Output settings
-        scene.render.resolution_x = 1920
-        scene.render.resolution_y = 1080
-        scene.render.resolution_percentage = 100
-
         # Color management
         scene.view_settings.view_transform = 'Filmic'
         scene.view_settings.look = 'High Contrast'
         scene.view_settings.exposure = 0.5
         scene.view_settings.gamma = 1.0
 
-        # Output format
-        scene.render.image_settings.file_format = 'FFMPEG'
-        scene.render.ffmpeg.format = 'MPEG4'
-        scene.render.ffmpeg.codec = 'H264'
-        scene.render.ffmpeg.constant_rate_factor = 'HIGH'
-        scene.render.ffmpeg.ffmpeg_preset = 'BEST'
-        scene.render.ffmpeg.audio_codec = 'NONE'
-
-        # Set output path
-        scene.render.filepath = os.path.join(self.output_path, 'alter_logo_animation_')
-
     def setup_animation(self):
         """Main setup function to create entire animation with robust error handling"""
         print("=" * 60)
@@ -610,12 +856,22 @@ class LogoAnimationSetup:
         print("=" * 60)
         print()
 
+        # The user's simplify settings, put back whether or not setup succeeds
+        scene = bpy.context.scene
+        simplify_state = (scene.render.use_simplify, scene.render.simplify_subdivision)
+
         try:
             # Clear scene
             print("[1/10] Clearing scene...")
             self.clear_scene()
+            self.configure_basic_render_settings()
             print("  ✓ Scene cleared")
 
+            # Simplify modifier evaluation while the scene is being built,
+            # restored below before the file is saved
+            scene.render.use_simplify = True
+            scene.render.simplify_subdivision = 0
+
             # Import logo
             print("\n[2/10] Importing SVG logo...")
             self.import_svg_logo()
@@ -661,9 +917,13 @@ class LogoAnimationSetup:
 
             # Configure render
             print("\n[9/10] Configuring render settings...")
-            self.configure_render_settings()
+            self.configure_quality_render_settings()
             print("  ✓ Render settings applied")
 
+            # Restore simplify settings and evaluate the finished scene once
+            scene.render.use_simplify, scene.render.simplify_subdivision = simplify_state
+            bpy.context.view_layer.update()
+
             # Save file
             print("\n[10/10] Saving blend file...")
             blend_path = os.path.join(
@@ -693,13 +953,16 @@ class LogoAnimationSetup:
             print(f"\nError: {str(e)}")
             print("\nPlease check:")
             print("  • alter.svg exists in project folder")
-            print("  • Blender version is 3.0 or higher")
+            print("  • Blender version is 3.2 or higher")
             print("  • You have write permissions")
             print()
             import traceback
             traceback.print_exc()
             raise
 
+        finally:
+            scene.render.use_simplify, scene.render.simplify_subdivision = simplify_state
+
 
 def main():
     """Main execution function"""